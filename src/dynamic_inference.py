@@ -0,0 +1,232 @@
+"""
+Módulo para realizar inferencia en redes bayesianas dinámicas (2TBN).
+
+La inferencia se basa en la interfaz de la red: el conjunto de variables del
+slice t-1 con hijos en el slice t. La distribución sobre la interfaz resume
+toda la historia, por lo que cada nuevo paso de tiempo tiene un coste constante
+sin desenrollar la red ni volver a enumerar las observaciones anteriores.
+"""
+from collections import deque
+from itertools import product
+
+from src.inference import check_evidence, probability
+from src.loader import PREV_SUFFIX
+
+def _slice_assignments(evidence, dbn):
+    """
+    Genera todas las asignaciones de un slice consistentes con la evidencia.
+
+    Args:
+        evidence (dict): Evidencia observada en el slice.
+        dbn (dict): Estructura de la red bayesiana dinámica.
+
+    Returns:
+        iterator: Tuplas de valores en el orden de dbn['variables'].
+    """
+    domains = [[evidence[var]] if var in evidence else dbn['values'][var]
+               for var in dbn['variables']]
+    return product(*domains)
+
+def _interface_key(assignment, dbn):
+    """
+    Proyecta una asignación de un slice sobre las variables de la interfaz.
+    """
+    return tuple(assignment[dbn['variables'].index(var)] for var in dbn['interface'])
+
+def _slice_probability(assignment, prev, dbn):
+    """
+    Calcula P(slice=assignment | interfaz anterior=prev).
+
+    Args:
+        assignment (tuple): Valores del slice en el orden de dbn['variables'].
+        prev (tuple): Valores de la interfaz del slice anterior, o None en el slice inicial.
+        dbn (dict): Estructura de la red bayesiana dinámica.
+
+    Returns:
+        float: Probabilidad del slice dado el slice anterior.
+    """
+    values = dict(zip(dbn['variables'], assignment))
+    if prev is None:
+        bn = dbn['prior']
+    else:
+        bn = dbn['transition']
+        values.update({f"{var}{PREV_SUFFIX}": val for var, val in zip(dbn['interface'], prev)})
+
+    result = 1.0
+    for var in dbn['variables']:
+        parent_vals = {p: values[p] for p in bn['parents'].get(var, [])}
+        result *= probability(var, values[var], parent_vals, bn)
+    return result
+
+def _normalize(table):
+    """
+    Normaliza una tabla de pesos para que sume 1.
+    """
+    total = sum(table.values())
+    if total == 0:
+        raise ValueError("La evidencia tiene probabilidad cero")
+    return {key: weight / total for key, weight in table.items()}
+
+def _marginal(X, table, dbn):
+    """
+    Obtiene la distribución de X a partir de una tabla sobre asignaciones del slice.
+    """
+    index = dbn['variables'].index(X)
+    Q = {x: 0.0 for x in dbn['values'][X]}
+    for assignment, weight in table.items():
+        Q[assignment[index]] += weight
+    return _normalize(Q)
+
+def forward_step(message, evidence, dbn):
+    """
+    Avanza un paso de tiempo el filtrado hacia delante.
+
+    Args:
+        message (dict): Distribución sobre la interfaz del slice anterior, o None
+            para el slice inicial.
+        evidence (dict): Evidencia observada en el nuevo slice.
+        dbn (dict): Estructura de la red bayesiana dinámica.
+
+    Returns:
+        tuple: (nuevo mensaje sobre la interfaz, tabla normalizada sobre las
+            asignaciones del slice consistentes con la evidencia).
+    """
+    check_evidence(evidence, dbn)
+
+    table = {}
+    for assignment in _slice_assignments(evidence, dbn):
+        if message is None:
+            table[assignment] = _slice_probability(assignment, None, dbn)
+        else:
+            table[assignment] = sum(weight * _slice_probability(assignment, prev, dbn)
+                                    for prev, weight in message.items())
+    table = _normalize(table)
+
+    new_message = {}
+    for assignment, weight in table.items():
+        key = _interface_key(assignment, dbn)
+        new_message[key] = new_message.get(key, 0.0) + weight
+
+    return new_message, table
+
+def backward_step(beta, evidence, dbn):
+    """
+    Retrocede un paso de tiempo el mensaje hacia atrás.
+
+    Args:
+        beta (dict): P(evidencia futura | interfaz del slice t+1), o None en el último slice.
+        evidence (dict): Evidencia observada en el slice t+1.
+        dbn (dict): Estructura de la red bayesiana dinámica.
+
+    Returns:
+        dict: Mensaje (normalizado) sobre la interfaz del slice t.
+    """
+    new_beta = {}
+    for prev in product(*[dbn['values'][var] for var in dbn['interface']]):
+        total = 0.0
+        for assignment in _slice_assignments(evidence, dbn):
+            weight = 1.0 if beta is None else beta[_interface_key(assignment, dbn)]
+            if weight:
+                total += _slice_probability(assignment, prev, dbn) * weight
+        new_beta[prev] = total
+    return _normalize(new_beta)
+
+def _smoothed(X, table, beta, dbn):
+    """
+    Combina la tabla hacia delante de un slice con el mensaje hacia atrás.
+    """
+    if beta is None:
+        return _marginal(X, table, dbn)
+    weighted = {assignment: weight * beta[_interface_key(assignment, dbn)]
+                for assignment, weight in table.items()}
+    return _marginal(X, weighted, dbn)
+
+def filtering(X, observations, dbn):
+    """
+    Calcula P(X_t | e_0:t) para cada slice de una secuencia de observaciones.
+
+    Es un generador: procesa las observaciones a medida que llegan, con coste
+    constante por paso.
+
+    Args:
+        X (str): Variable de consulta.
+        observations (iterable): Evidencia (dict) de cada slice, empezando en t=0.
+        dbn (dict): Estructura de la red bayesiana dinámica.
+
+    Returns:
+        iterator: Distribución de X en cada slice.
+    """
+    message = None
+    for evidence in observations:
+        message, table = forward_step(message, evidence, dbn)
+        yield _marginal(X, table, dbn)
+
+def smoothing(X, observations, dbn):
+    """
+    Calcula P(X_t | e_0:T) para todos los slices mediante forward-backward.
+
+    Args:
+        X (str): Variable de consulta.
+        observations (list): Evidencia (dict) de cada slice, empezando en t=0.
+        dbn (dict): Estructura de la red bayesiana dinámica.
+
+    Returns:
+        list: Distribución suavizada de X en cada slice.
+    """
+    observations = list(observations)
+
+    tables = []
+    message = None
+    for evidence in observations:
+        message, table = forward_step(message, evidence, dbn)
+        tables.append(table)
+
+    result = [None] * len(observations)
+    beta = None
+    for t in range(len(observations) - 1, -1, -1):
+        result[t] = _smoothed(X, tables[t], beta, dbn)
+        beta = backward_step(beta, observations[t], dbn)
+    return result
+
+def fixed_lag_smoothing(X, observations, dbn, lag):
+    """
+    Calcula P(X_t-lag | e_0:t) a medida que llegan las observaciones.
+
+    El coste de cada paso depende solo del retardo, no de la longitud de la
+    secuencia. Al agotarse las observaciones se emiten los últimos slices
+    pendientes suavizados con toda la evidencia.
+
+    Args:
+        X (str): Variable de consulta.
+        observations (iterable): Evidencia (dict) de cada slice, empezando en t=0.
+        dbn (dict): Estructura de la red bayesiana dinámica.
+        lag (int): Número de slices de retardo.
+
+    Returns:
+        iterator: Tuplas (t, distribución suavizada de X en el slice t).
+    """
+    if lag < 0:
+        raise ValueError("El retardo debe ser mayor o igual que 0")
+
+    window = deque()
+    message = None
+    t = 0
+    for evidence in observations:
+        message, table = forward_step(message, evidence, dbn)
+        window.append((table, evidence))
+        if len(window) > lag:
+            beta = None
+            for _, future in reversed(list(window)[1:]):
+                beta = backward_step(beta, future, dbn)
+            yield t, _smoothed(X, window[0][0], beta, dbn)
+            window.popleft()
+            t += 1
+
+    # Vaciar la ventana con la evidencia disponible
+    while window:
+        beta = None
+        for _, future in reversed(list(window)[1:]):
+            beta = backward_step(beta, future, dbn)
+        yield t, _smoothed(X, window[0][0], beta, dbn)
+        window.popleft()
+        t += 1
@@ -125,6 +125,20 @@ def enumerate_all(variables, evidence, bn, debug=False, trace=None, indent=0):
         
         return total
 
+def check_evidence(evidence, bn):
+    """
+    Verifica que todas las variables y valores de la evidencia existan en la red.
+    
+    Args:
+        evidence (dict): Evidencia observada.
+        bn (dict): Estructura de la red (debe incluir 'values').
+    """
+    for var, value in evidence.items():
+        if var not in bn['values']:
+            raise ValueError(f"La variable {var} no pertenece a la red")
+        if value not in bn['values'][var]:
+            raise ValueError(f"Valor {value} no válido para {var}: {bn['values'][var]}")
+
 def probability(var, value, parent_vals, bn):
     """
     Obtiene la probabilidad de una variable dado sus padres.
@@ -5,6 +5,11 @@ import csv
 import os
 import pandas as pd
 
+# Sufijo para nombrar en el slice t a las variables del slice t-1
+PREV_SUFFIX = "_prev"
+# Sufijo de los archivos CSV con las tablas de transición (p. ej. rain_t.csv)
+TRANSITION_SUFFIX = "_t"
+
 def load_graph(graph_path):
     """
     Carga la estructura del grafo desde un archivo CSV.
@@ -76,36 +81,49 @@ def load_probabilities(data_dir):
     for var in variables:
         var_path = os.path.join(data_dir, f"{var}.csv")
         if os.path.exists(var_path):
-            df = pd.read_csv(var_path)
-            
-            # Procesar tabla sin padres (solo probabilidades)
-            if len(df.columns) == 2 and df.columns[0] == 'value' and df.columns[1] == 'prob':
-                probabilities[var] = {row['value']: float(row['prob']) for _, row in df.iterrows() if pd.notna(row['value'])}
-            # Procesar tabla con padres
-            else:
-                var_parents = parents.get(var, [])
-                prob_table = []
-                
-                for _, row in df.iterrows():
-                    if any(pd.isna(val) for val in row.values):
-                        continue
-                        
-                    table_row = {}
-                    for parent in var_parents:
-                        if parent in df.columns:
-                            table_row[parent] = row[parent]
-                    
-                    # Añadir las probabilidades para cada valor posible de la variable
-                    for col in df.columns:
-                        if col not in var_parents:
-                            table_row[col] = float(row[col])
-                    
-                    prob_table.append(table_row)
-                
-                probabilities[var] = prob_table
+            probabilities[var] = load_cpt(var_path, parents.get(var, []))
     
     return probabilities
 
+def load_cpt(var_path, var_parents):
+    """
+    Carga la tabla de probabilidad de una única variable.
+    
+    Args:
+        var_path (str): Ruta al archivo CSV de la variable.
+        var_parents (list): Padres de la variable (nombres de columna en el CSV).
+        
+    Returns:
+        dict | list: Diccionario valor -> probabilidad si la variable no tiene padres,
+            o lista de filas (diccionarios) si es una tabla condicional.
+    """
+    df = pd.read_csv(var_path)
+    
+    # Procesar tabla sin padres (solo probabilidades)
+    if len(df.columns) == 2 and df.columns[0] == 'value' and df.columns[1] == 'prob':
+        return {row['value']: float(row['prob']) for _, row in df.iterrows() if pd.notna(row['value'])}
+    
+    # Procesar tabla con padres
+    prob_table = []
+    
+    for _, row in df.iterrows():
+        if any(pd.isna(val) for val in row.values):
+            continue
+            
+        table_row = {}
+        for parent in var_parents:
+            if parent in df.columns:
+                table_row[parent] = row[parent]
+        
+        # Añadir las probabilidades para cada valor posible de la variable
+        for col in df.columns:
+            if col not in var_parents:
+                table_row[col] = float(row[col])
+        
+        prob_table.append(table_row)
+    
+    return prob_table
+
 def get_variable_values(bn):
     """
     Extrae todos los valores posibles para cada variable de las tablas de probabilidad.
@@ -170,4 +188,80 @@ def build_bayesian_network(data_dir):
                     if col not in var_parents:
                         bn["values"][var].append(col)
     
-    return bn
\ No newline at end of file
+    return bn
+
+def build_dynamic_bayesian_network(data_dir):
+    """
+    Construye una red bayesiana dinámica de dos slices (2TBN).
+    
+    El directorio extiende el formato estático:
+        - graph.csv: aristas dentro de un mismo slice.
+        - transition.csv: aristas entre slices (origin en t-1, destination en t).
+        - {var}.csv: tablas del slice inicial, solo con padres del mismo slice.
+        - {var}_t.csv: tablas de transición de las variables con padres en t-1.
+          Las columnas de esos padres se nombran {padre}_prev.
+    
+    Args:
+        data_dir (str): Directorio con los archivos CSV.
+        
+    Returns:
+        dict: Diccionario con las variables del slice, la interfaz (variables de t-1
+            con hijos en t), la red del slice inicial y la red de transición.
+    """
+    graph_path = os.path.join(data_dir, "graph.csv")
+    transition_path = os.path.join(data_dir, "transition.csv")
+    
+    variables = sorted(set(get_variables(graph_path)) | set(get_variables(transition_path)))
+    parents = load_structure(graph_path)
+    inter_parents = load_structure(transition_path)
+    interface = [var for var in variables
+                 if any(var in origins for origins in inter_parents.values())]
+    
+    # Slice inicial: red estática con las aristas de graph.csv
+    probabilities = {}
+    for var in variables:
+        probabilities[var] = load_cpt(os.path.join(data_dir, f"{var}.csv"), parents.get(var, []))
+    values = get_variable_values({"probabilities": probabilities, "parents": parents})
+    
+    # Transición: cada variable conserva sus padres del slice y añade los de t-1
+    transition_parents = {}
+    transition_probabilities = {}
+    for var in variables:
+        var_parents = parents.get(var, []) + [f"{p}{PREV_SUFFIX}" for p in inter_parents.get(var, [])]
+        if var_parents:
+            transition_parents[var] = var_parents
+        if var in inter_parents:
+            var_path = os.path.join(data_dir, f"{var}{TRANSITION_SUFFIX}.csv")
+            transition_probabilities[var] = load_cpt(var_path, var_parents)
+            
+            # La tabla de transición debe tener los mismos valores que la del slice inicial
+            transition_values = get_variable_values({
+                "probabilities": {var: transition_probabilities[var]},
+                "parents": {var: var_parents}
+            })[var]
+            if set(transition_values) != set(values[var]):
+                raise ValueError(f"Los valores de {var}{TRANSITION_SUFFIX}.csv {transition_values} "
+                                 f"no coinciden con los de {var}.csv {values[var]}")
+        else:
+            transition_probabilities[var] = probabilities[var]
+    
+    prior = {
+        "variables": variables,
+        "parents": parents,
+        "probabilities": probabilities,
+        "values": values
+    }
+    transition = {
+        "variables": variables,
+        "parents": transition_parents,
+        "probabilities": transition_probabilities,
+        "values": values
+    }
+    
+    return {
+        "variables": variables,
+        "interface": interface,
+        "values": values,
+        "prior": prior,
+        "transition": transition
+    }
@@ -3,9 +3,11 @@ Programa principal para ejecutar el sistema de inferencia bayesiana.
 """
 import os
 import sys
-from src.loader import load_graph, build_bayesian_network
+from src.loader import load_graph, build_bayesian_network, build_dynamic_bayesian_network
 from src.visualize import draw_graph, draw_conditional_probabilities
 from src.inference import enumeration_ask
+from src.dynamic_inference import filtering, smoothing
+from src.sensitivity import sensitivity_ask, format_sensitivity_table
 
 def run_example_from_class(data_dir="data"):
     """
@@ -235,15 +237,82 @@ def run_custom_example(data_dir="data_custom"):
     for k, v in query3.items():
         print(f"P({query_var3}={k} | descanso=suficiente, ansiedad=baja) = {v:.4f}")
 
+def run_dynamic_example(data_dir="data_dynamic"):
+    """
+    Ejecuta el ejemplo de red bayesiana dinámica (lluvia y retrasos día a día).
+    
+    Args:
+        data_dir (str): Directorio con los archivos CSV de la red de dos slices.
+    """
+    print("\n\n===== EJEMPLO DINÁMICO =====")
+    
+    if not os.path.exists(data_dir):
+        print(f"ERROR: El directorio {data_dir} no existe.")
+        return
+    
+    try:
+        dbn = build_dynamic_bayesian_network(data_dir)
+    except Exception as e:
+        print(f"ERROR al cargar la red bayesiana dinámica: {e}")
+        return
+    
+    print("\nRed dinámica cargada correctamente:")
+    print("Variables por slice:", dbn["variables"])
+    print("Interfaz entre slices:", dbn["interface"])
+    
+    observations = [
+        {"train": "delayed"},
+        {"train": "delayed", "appointment": "miss"},
+        {"train": "on time"},
+        {"appointment": "attend"},
+    ]
+    
+    print("\nFILTRADO: P(rain_t | e_0:t)")
+    for t, dist in enumerate(filtering("rain", observations, dbn)):
+        print(f"t={t} {observations[t]}: " + ", ".join(f"{k}={v:.4f}" for k, v in dist.items()))
+    
+    print("\nSUAVIZADO: P(rain_t | e_0:T)")
+    for t, dist in enumerate(smoothing("rain", observations, dbn)):
+        print(f"t={t} {observations[t]}: " + ", ".join(f"{k}={v:.4f}" for k, v in dist.items()))
+
+def run_sensitivity_example(data_dir="data"):
+    """
+    Ejecuta el análisis de sensibilidad de P(appointment=attend | rain=none).
+    
+    Args:
+        data_dir (str): Directorio con los archivos CSV.
+    """
+    print("\n\n===== ANÁLISIS DE SENSIBILIDAD =====")
+    
+    if not os.path.exists(data_dir):
+        print(f"ERROR: El directorio {data_dir} no existe.")
+        return
+    
+    try:
+        bn = build_bayesian_network(data_dir)
+    except Exception as e:
+        print(f"ERROR al cargar la red bayesiana: {e}")
+        return
+    
+    evidence = {"rain": "none"}
+    prob, rows = sensitivity_ask("appointment", "attend", evidence, bn)
+    
+    print(f"\nP(appointment=attend | rain=none) = {prob:.4f}")
+    print("\nDerivadas respecto a cada parámetro de las CPT (ordenadas por |co-variada|):")
+    print(format_sensitivity_table(rows))
+
 def main():
     """
-    Función principal que ejecuta ambos ejemplos.
+    Función principal que ejecuta los ejemplos de clase, personalizado,
+    dinámico y el análisis de sensibilidad.
     """
     print("Sistema de Inferencia por Enumeración en Redes Bayesianas")
     print("--------------------------------------------------------")
     
     run_example_from_class()
     run_custom_example()
+    run_dynamic_example()
+    run_sensitivity_example()
 
 if __name__ == "__main__":
     main()
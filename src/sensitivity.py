@@ -0,0 +1,185 @@
+"""
+Módulo para el análisis de sensibilidad de una consulta respecto a los parámetros de las CPT.
+
+Se usa el enfoque diferencial: la probabilidad de la evidencia es un polinomio
+multilineal en los parámetros θ(v|u), de modo que una sola enumeración de la
+distribución conjunta acumula a la vez las derivadas parciales de P(x, e) y P(e)
+respecto a todos los parámetros, en lugar de una inferencia por parámetro.
+"""
+import math
+from itertools import product
+
+from src.inference import check_evidence, probability
+
+def _parameter_key(var, value, assignment, bn):
+    """
+    Identifica el parámetro θ(var=value | padres) usado por una asignación completa.
+    """
+    parents = bn['parents'].get(var, [])
+    return (var, tuple((p, assignment[p]) for p in parents), value)
+
+def cpt_parameters(bn):
+    """
+    Enumera todos los parámetros de las CPT de la red.
+
+    Args:
+        bn (dict): Estructura de la red bayesiana.
+
+    Returns:
+        dict: Diccionario parámetro -> θ, con el mismo formato de clave que network_derivatives.
+    """
+    thetas = {}
+    for var in bn['variables']:
+        table = bn['probabilities'][var]
+        rows = [table] if isinstance(table, dict) else table
+        for row in rows:
+            for value in bn['values'][var]:
+                thetas[_parameter_key(var, value, row, bn)] = row[value]
+    return thetas
+
+def network_derivatives(X, x, evidence, bn):
+    """
+    Calcula P(e), P(x, e) y sus derivadas parciales respecto a todos los parámetros
+    de las CPT en una única enumeración sobre la evidencia.
+
+    Cada término de P(x, e) es también un término de P(e) (aquel con X=x), así que
+    basta con sumarlo además a los acumuladores de P(x, e).
+
+    Args:
+        X (str): Variable de consulta.
+        x (str): Valor de la variable de consulta.
+        evidence (dict): Evidencia observada.
+        bn (dict): Estructura de la red bayesiana.
+
+    Returns:
+        tuple: (P(e), dict parámetro -> ∂P(e)/∂θ, P(x, e), dict parámetro -> ∂P(x, e)/∂θ).
+            Cada parámetro es una tupla (variable, ((padre, valor), ...), valor).
+    """
+    variables = list(bn['variables'])
+    domains = [[evidence[var]] if var in evidence else bn['values'][var] for var in variables]
+
+    p_e = 0.0
+    p_xe = 0.0
+    d_e = {}
+    d_xe = {}
+    for combo in product(*domains):
+        assignment = dict(zip(variables, combo))
+        matches_query = assignment[X] == x
+        keys = []
+        factors = []
+        for var in variables:
+            parent_vals = {p: assignment[p] for p in bn['parents'].get(var, [])}
+            key = _parameter_key(var, assignment[var], assignment, bn)
+            keys.append(key)
+            factors.append(probability(var, assignment[var], parent_vals, bn))
+
+        # Productos por la izquierda y por la derecha para excluir cada factor sin dividir
+        prefix = [1.0]
+        for f in factors:
+            prefix.append(prefix[-1] * f)
+        suffix = 1.0
+        for i in range(len(factors) - 1, -1, -1):
+            partial = prefix[i] * suffix
+            d_e[keys[i]] = d_e.get(keys[i], 0.0) + partial
+            if matches_query:
+                d_xe[keys[i]] = d_xe.get(keys[i], 0.0) + partial
+            suffix *= factors[i]
+
+        p_e += prefix[-1]
+        if matches_query:
+            p_xe += prefix[-1]
+
+    return p_e, d_e, p_xe, d_xe
+
+def sensitivity_ask(X, x, evidence, bn):
+    """
+    Calcula la sensibilidad de P(X=x | evidence) respecto a cada parámetro de las CPT.
+
+    Para cada parámetro se devuelve la derivada parcial y la derivada con
+    co-variación proporcional, que reparte el cambio entre los demás valores
+    de la misma fila para que siga sumando 1. En una fila determinista (θ=1)
+    los demás valores son 0 y la co-variación proporcional no está definida,
+    por lo que 'covaried' vale NaN y la fila se coloca al final del ranking.
+
+    Args:
+        X (str): Variable de consulta.
+        x (str): Valor de la variable de consulta.
+        evidence (dict): Evidencia observada.
+        bn (dict): Estructura de la red bayesiana.
+
+    Returns:
+        tuple: (P(X=x | evidence), lista de filas ordenadas por el valor absoluto
+            de la derivada con co-variación). Cada fila es un diccionario con las
+            claves 'variable', 'parents', 'value', 'theta', 'derivative' y 'covaried'.
+    """
+    if X in evidence:
+        raise ValueError(f"La variable de consulta {X} no puede estar en la evidencia")
+    check_evidence({X: x}, bn)
+    check_evidence(evidence, bn)
+
+    p_e, d_e, p_xe, d_xe = network_derivatives(X, x, evidence, bn)
+    if p_e == 0:
+        raise ValueError("La evidencia tiene probabilidad cero")
+
+    # Regla del cociente: ∂P(x|e)/∂θ = (∂P(x,e)·P(e) - P(x,e)·∂P(e)) / P(e)^2
+    thetas = cpt_parameters(bn)
+    partial = {key: (d_xe.get(key, 0.0) * p_e - p_xe * d_e.get(key, 0.0)) / p_e ** 2
+               for key in thetas}
+
+    rows = []
+    for (var, parents, value), theta in thetas.items():
+        derivative = partial[(var, parents, value)]
+
+        # Co-variación proporcional: los demás valores de la fila se escalan por (1-θ')/(1-θ)
+        if theta < 1:
+            covaried = derivative
+            for other in bn['values'][var]:
+                if other != value:
+                    other_key = (var, parents, other)
+                    covaried -= thetas[other_key] / (1 - theta) * partial[other_key]
+        else:
+            covaried = math.nan
+
+        rows.append({
+            'variable': var,
+            'parents': dict(parents),
+            'value': value,
+            'theta': theta,
+            'derivative': derivative,
+            'covaried': covaried
+        })
+
+    rows.sort(key=lambda row: (math.isnan(row['covaried']), -abs(row['covaried'])))
+    return p_xe / p_e, rows
+
+def format_sensitivity_table(rows, top=None):
+    """
+    Da formato de tabla a las filas devueltas por sensitivity_ask.
+
+    Args:
+        rows (list): Filas de sensibilidad ordenadas.
+        top (int): Número máximo de filas a mostrar (todas si es None).
+
+    Returns:
+        str: Tabla de texto con el ranking de parámetros. Las filas deterministas
+            (θ=1) muestran "nan" en la columna co-variada y se indica con una nota.
+    """
+    if top is not None:
+        rows = rows[:top]
+
+    labels = []
+    for row in rows:
+        parent_str = ", ".join(f"{p}={v}" for p, v in row['parents'].items())
+        if parent_str:
+            labels.append(f"P({row['variable']}={row['value']} | {parent_str})")
+        else:
+            labels.append(f"P({row['variable']}={row['value']})")
+
+    width = max([len("Parámetro")] + [len(label) for label in labels])
+    lines = [f"{'#':>3}  {'Parámetro':<{width}}  {'θ':>8}  {'∂/∂θ':>10}  {'co-variada':>10}"]
+    for i, (label, row) in enumerate(zip(labels, rows), start=1):
+        lines.append(f"{i:>3}  {label:<{width}}  {row['theta']:>8.4f}  "
+                     f"{row['derivative']:>10.4f}  {row['covaried']:>10.4f}")
+    if any(math.isnan(row['covaried']) for row in rows):
+        lines.append("\nnan: fila determinista (θ=1), la co-variación proporcional no está definida")
+    return "\n".join(lines)